@@ -0,0 +1,71 @@
+"""On-disk parse cache — skips re-parsing files unchanged since the last run."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+from codesleuth.models import ParseResult
+
+
+class ParseCache:
+    """Stores pickled :class:`ParseResult` objects keyed by file identity.
+
+    Keys are derived from the absolute path plus mtime and size, so any edit
+    (or touch) invalidates the entry naturally. Entries are sharded into
+    ``cache_dir/<key[:2]>/<key>.pkl`` and written atomically; a corrupt or
+    unreadable entry is treated as a miss. Delete the directory to bust the
+    cache wholesale.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def key_for(abs_path: str) -> str | None:
+        """Compute the cache key for a file, or ``None`` if it can't be statted."""
+        try:
+            st = os.stat(abs_path)
+        except OSError:
+            return None
+        ident = f"{abs_path}:{st.st_mtime_ns}:{st.st_size}".encode()
+        return hashlib.blake2b(ident).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pkl"
+
+    def get(self, key: str) -> ParseResult | None:
+        """Load a cached result, or ``None`` on miss / corrupt entry."""
+        try:
+            with self._entry_path(key).open("rb") as f:
+                result = pickle.load(f)
+        except Exception:
+            # Truncated/garbage payloads raise ValueError, IndexError, or
+            # UnicodeDecodeError; entries written by an older codesleuth can
+            # raise ImportError on unpickle. Whatever the failure, a cache
+            # entry must degrade to a miss, never crash the scan.
+            return None
+        return result if isinstance(result, ParseResult) else None
+
+    def put(self, key: str, result: ParseResult) -> None:
+        """Store a result atomically (best-effort — cache errors are ignored)."""
+        entry = self._entry_path(key)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(result, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, entry)
+        except OSError:
+            pass
@@ -2,23 +2,43 @@
 
 from __future__ import annotations
 
+import os
+from importlib.metadata import entry_points
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
-from codesleuth.graph_builder import CallGraphBuilder
-from codesleuth.parsers.js_ts_parser import JSTypeScriptParser
-from codesleuth.parsers.python_parser import PythonParser
-from codesleuth.parsers.registry import ParserRegistry
-from codesleuth.renderers.mermaid_renderer import MermaidRenderer
-from codesleuth.scanner import FileScanner
+if TYPE_CHECKING:
+    from codesleuth.parsers.registry import ParserRegistry
+
+# Parser, scanner, and renderer imports are deferred into _build_registry and
+# main so that `--help` and shell completion don't pay for tree-sitter's
+# native library loads.
 
 
 def _build_registry() -> ParserRegistry:
-    """Create a registry pre-loaded with all built-in parsers."""
+    """Create a registry pre-loaded with all built-in and plugin parsers.
+
+    Third-party parsers can hook in through the ``codesleuth.parsers``
+    entry-point group; each entry point must resolve to a
+    :class:`BaseParser` subclass.
+    """
+    from codesleuth.parsers.js_ts_parser import JSTypeScriptParser
+    from codesleuth.parsers.python_parser import PythonParser
+    from codesleuth.parsers.registry import ParserRegistry
+
     registry = ParserRegistry()
     registry.register(PythonParser())
     registry.register(JSTypeScriptParser())
+
+    for ep in entry_points(group="codesleuth.parsers"):
+        try:
+            parser_cls = ep.load()
+            registry.register(parser_cls())
+        except Exception as exc:
+            click.echo(f"⚠️  Failed to load parser plugin {ep.name!r}: {exc}", err=True)
+
     return registry
 
 
@@ -84,6 +104,18 @@ def _build_registry() -> ParserRegistry:
     multiple=True,
     help="Glob patterns to exclude (can be specified multiple times).",
 )
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Number of parser processes [default: CPU count].",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Cache parse results here for incremental runs (e.g. .codesleuth_cache).",
+)
 def main(
     target_dir: str,
     output_path: str,
@@ -95,18 +127,32 @@ def main(
     max_docstring_length: int,
     include_orphans: bool,
     exclude: tuple[str, ...],
+    workers: int | None,
+    cache_dir: str | None,
 ) -> None:
     """Scan TARGET_DIR and generate a Mermaid call-graph diagram."""
+    from codesleuth.graph_builder import CallGraphBuilder
+    from codesleuth.renderers.mermaid_renderer import MermaidRenderer
+    from codesleuth.scanner import FileScanner
+
     root = Path(target_dir)
 
     click.echo(f"🔍 Scanning {root} …")
 
     registry = _build_registry()
-    scanner = FileScanner(root, registry, extra_excludes=list(exclude))
-    results = scanner.scan()
+    scanner = FileScanner(
+        root,
+        registry,
+        extra_excludes=list(exclude),
+        registry_factory=_build_registry,
+        cache_dir=Path(cache_dir) if cache_dir else None,
+    )
+    results = scanner.scan(workers=workers)
 
-    total_funcs = sum(len(r.functions) for r in results)
-    total_calls = sum(len(r.calls) for r in results)
+    total_funcs = total_calls = 0
+    for r in results:
+        total_funcs += len(r.functions)
+        total_calls += len(r.calls)
     click.echo(f"   Found {total_funcs} functions and {total_calls} call sites across {len(results)} files.")
 
     click.echo("🔗 Building call graph …")
@@ -130,9 +176,9 @@ def main(
     if split:
         out_dir = Path(output_path).with_suffix("")  # strip .md if given
         click.echo(f"📂 Splitting into components → {out_dir}/")
-        written = renderer.render_components(graph, out_dir, **opts)
-        click.echo(f"✅ Wrote {len(written)} files (including index.md).")
-        md_files = [f for f in written if f.name.startswith("component_")]
+        _, component_paths = renderer.render_components(graph, out_dir, **opts)
+        click.echo(f"✅ Wrote {len(component_paths) + 1} files (including index.md).")
+        md_files = component_paths
     else:
         out = Path(output_path)
         click.echo(f"📄 Rendering → {out}")
@@ -153,12 +199,21 @@ def main(
             raise SystemExit(1)
 
         click.echo(f"🖼️  Exporting {len(md_files)} diagram(s) to PNG ({width}×{height}) …")
-        for md_file in md_files:
-            try:
-                png_path = export_png(md_file, width=width, height=height)
-                click.echo(f"   ✅ {png_path}")
-            except Exception as exc:
-                click.echo(f"   ❌ {md_file.name}: {exc}", err=True)
+        # Each export is an external mmdc process, so threads give real
+        # parallelism; results are reported in submission order.
+        from concurrent.futures import ThreadPoolExecutor
+
+        jobs = min(workers or os.cpu_count() or 1, 8)
+        with ThreadPoolExecutor(max_workers=max(jobs, 1)) as executor:
+            futures = [
+                executor.submit(export_png, md_file, width=width, height=height)
+                for md_file in md_files
+            ]
+            for md_file, future in zip(md_files, futures):
+                try:
+                    click.echo(f"   ✅ {future.result()}")
+                except Exception as exc:
+                    click.echo(f"   ❌ {md_file.name}: {exc}", err=True)
 
 
 if __name__ == "__main__":
@@ -18,48 +18,77 @@ class CallGraphBuilder:
         self._functions: list[FunctionNode] = []
         self._edges: list[CallEdge] = []
 
-        # Lookup indices built during the resolution phase.
+        # Lookup indices, populated as results are ingested.
         self._by_name: dict[str, list[FunctionNode]] = defaultdict(list)
         self._by_qualified: dict[str, FunctionNode] = {}
         self._by_file: dict[Path, list[FunctionNode]] = defaultdict(list)
+        self._by_file_name: dict[tuple[Path, str], list[FunctionNode]] = defaultdict(list)
+        self._by_class_name: dict[tuple[str, str], list[FunctionNode]] = defaultdict(list)
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
     def add_results(self, results: list[ParseResult]) -> None:
-        """Ingest all parse results."""
+        """Ingest all parse results, indexing each function as it arrives.
+
+        Indexing inline means the function list is walked exactly once,
+        rather than extended here and re-traversed by a separate index pass
+        in :meth:`build`.
+        """
         for r in results:
-            self._functions.extend(r.functions)
+            # Prefer the parser-supplied name buckets; derive them only for
+            # results from parsers that don't track the index.
+            has_index = bool(r.name_index)
+            for fn in r.functions:
+                self._functions.append(fn)
+                if not has_index:
+                    self._by_name[fn.name].append(fn)
+                self._by_qualified[fn.qualified_name] = fn
+                self._by_file[fn.file_path].append(fn)
+                self._by_file_name[(fn.file_path, fn.name)].append(fn)
+                if fn.class_name:
+                    self._by_class_name[(fn.class_name, fn.name)].append(fn)
+            for name, fns in r.name_index.items():
+                self._by_name[name].extend(fns)
             self._edges.extend(r.calls)
 
     def build(self) -> CallGraph:
-        """Build the symbol table, resolve edges, and return the graph."""
-        self._build_index()
-        self._resolve_edges()
-        return CallGraph(nodes=list(self._functions), edges=list(self._edges))
+        """Resolve edges against the symbol table and return the graph."""
+        # Freeze the index buckets: resolution only iterates them, and tuples
+        # carry no list growth slack across tens of thousands of buckets.
+        self._by_name = {k: tuple(v) for k, v in self._by_name.items()}
+        self._by_file = {k: tuple(v) for k, v in self._by_file.items()}
+        self._by_file_name = {k: tuple(v) for k, v in self._by_file_name.items()}
+        self._by_class_name = {k: tuple(v) for k, v in self._by_class_name.items()}
 
-    # ------------------------------------------------------------------
-    # Index building
-    # ------------------------------------------------------------------
+        self._resolve_edges()
 
-    def _build_index(self) -> None:
-        self._by_name.clear()
-        self._by_qualified.clear()
-        self._by_file.clear()
+        # Stamp node-list indices on the edges so graph algorithms can skip
+        # the id()-keyed dict lookup per endpoint.
+        node_index = {id(fn): i for i, fn in enumerate(self._functions)}
+        for edge in self._edges:
+            edge.caller_idx = node_index.get(id(edge.caller), -1)
+            if edge.resolved_callee is not None:
+                edge.callee_idx = node_index.get(id(edge.resolved_callee), -1)
 
-        for fn in self._functions:
-            self._by_name[fn.name].append(fn)
-            self._by_qualified[fn.qualified_name] = fn
-            self._by_file[fn.file_path].append(fn)
+        return CallGraph(nodes=list(self._functions), edges=list(self._edges))
 
     # ------------------------------------------------------------------
     # Edge resolution
     # ------------------------------------------------------------------
 
     def _resolve_edges(self) -> None:
+        # Edges in the same file with the same callee name (and class context)
+        # always resolve identically, so memoize per resolution key — call
+        # names repeat heavily in real codebases (logging, self.helper, …).
+        cache: dict[tuple[Path, str, str | None], FunctionNode | None] = {}
         for edge in self._edges:
-            edge.resolved_callee = self._resolve(edge)
+            key = (edge.file_path, edge.callee_name, edge.caller.class_name)
+            if key in cache:
+                edge.resolved_callee = cache[key]
+            else:
+                edge.resolved_callee = cache[key] = self._resolve(edge)
 
     def _resolve(self, edge: CallEdge) -> FunctionNode | None:
         """Attempt to resolve a callee name to a FunctionNode.
@@ -83,18 +112,18 @@ class CallGraphBuilder:
 
         # 2. self.method — resolve within the caller's class.
         if parts[0] == "self" and len(parts) == 2 and edge.caller.class_name:
-            for fn in self._by_file.get(edge.file_path, []):
-                if fn.name == simple_name and fn.class_name == edge.caller.class_name:
-                    return fn
-            # Also search cross-file for the same class name.
-            for fn in self._by_name.get(simple_name, []):
+            for fn in self._by_file_name.get((edge.file_path, simple_name), ()):
                 if fn.class_name == edge.caller.class_name:
                     return fn
+            # Also search cross-file for the same class name.
+            class_matches = self._by_class_name.get((edge.caller.class_name, simple_name))
+            if class_matches:
+                return class_matches[0]
 
         # 3. Same-file match.
-        for fn in self._by_file.get(edge.file_path, []):
-            if fn.name == simple_name:
-                return fn
+        file_matches = self._by_file_name.get((edge.file_path, simple_name))
+        if file_matches:
+            return file_matches[0]
 
         # 4. Cross-file match (first hit).
         candidates = self._by_name.get(simple_name, [])
@@ -6,9 +6,13 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class FunctionNode:
-    """Represents a function or method definition in the codebase."""
+    """Represents a function or method definition in the codebase.
+
+    Slotted: large scans create one instance per function, and dropping the
+    per-instance ``__dict__`` roughly halves node storage.
+    """
 
     name: str
     """Simple name, e.g. 'parse_file'."""
@@ -31,8 +35,29 @@ class FunctionNode:
     params: list[str] = field(default_factory=list)
     """Parameter names."""
 
+    _hash: int = field(init=False, repr=False, default=0)
+    """Identity hash, precomputed once — nodes are hashed repeatedly by the
+    builder and renderer and are immutable after creation."""
+
+    def __post_init__(self) -> None:
+        self._hash = hash((self.qualified_name, self.file_path))
+
+    def __getstate__(self) -> dict:
+        # str hashes are salted per interpreter, so a pickled _hash (e.g. in
+        # the on-disk parse cache, or crossing a spawn-start worker boundary)
+        # would disagree with hashes minted in the loading process and break
+        # the eq/hash invariant. Never persist it.
+        return {
+            slot: getattr(self, slot) for slot in self.__slots__ if slot != "_hash"
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._hash = hash((self.qualified_name, self.file_path))
+
     def __hash__(self) -> int:
-        return hash((self.qualified_name, self.file_path))
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, FunctionNode):
@@ -43,7 +68,7 @@ class FunctionNode:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CallEdge:
     """Represents a function call found in the source code."""
 
@@ -62,6 +87,12 @@ class CallEdge:
     resolved_callee: FunctionNode | None = None
     """Resolved target node (filled during the resolution phase)."""
 
+    caller_idx: int = -1
+    """Caller's index in the built graph's node list (stamped by the builder)."""
+
+    callee_idx: int = -1
+    """Resolved callee's index in the built graph's node list, or -1."""
+
 
 @dataclass
 class ParseResult:
@@ -71,31 +102,54 @@ class ParseResult:
     functions: list[FunctionNode] = field(default_factory=list)
     calls: list[CallEdge] = field(default_factory=list)
 
+    name_index: dict[str, list[FunctionNode]] = field(default_factory=dict)
+    """Functions grouped by simple name, filled by parsers that track it so
+    the graph builder can merge buckets instead of re-deriving them."""
 
-@dataclass
+
+@dataclass(slots=True)
 class CallGraph:
-    """The complete cross-file call graph."""
+    """The complete cross-file call graph.
+
+    Graphs are built once by :class:`CallGraphBuilder` and treated as
+    immutable downstream, which lets derived views be computed lazily and
+    cached.
+    """
 
     nodes: list[FunctionNode] = field(default_factory=list)
     edges: list[CallEdge] = field(default_factory=list)
 
+    _resolved_edges: list[CallEdge] | None = field(default=None, init=False, repr=False)
+    _components: list[CallGraph] | None = field(default=None, init=False, repr=False)
+
     @property
     def resolved_edges(self) -> list[CallEdge]:
-        """Return only edges whose callee was successfully resolved."""
-        return [e for e in self.edges if e.resolved_callee is not None]
+        """Return only edges whose callee was successfully resolved.
+
+        Computed on first access and memoized — callers hit this repeatedly
+        (CLI stats, component splitting, rendering).
+        """
+        if self._resolved_edges is None:
+            self._resolved_edges = [e for e in self.edges if e.resolved_callee is not None]
+        return self._resolved_edges
 
     def connected_components(self) -> list[CallGraph]:
         """Split graph into connected components (undirected) and return each as a CallGraph.
 
-        Returns components sorted largest-first by node count.
+        Returns components sorted largest-first by node count. Memoized, like
+        :attr:`resolved_edges` — the split is recomputed only on the first
+        call for a given graph.
         """
+        if self._components is not None:
+            return self._components
         # Build adjacency using node indices.
         node_to_idx: dict[int, int] = {}
         for i, fn in enumerate(self.nodes):
             node_to_idx[id(fn)] = i
 
-        # Union-Find
+        # Union-Find (path compression + union by rank).
         parent = list(range(len(self.nodes)))
+        rank = [0] * len(self.nodes)
 
         def find(x: int) -> int:
             while parent[x] != x:
@@ -105,35 +159,56 @@ class CallGraph:
 
         def union(a: int, b: int) -> None:
             ra, rb = find(a), find(b)
-            if ra != rb:
-                parent[ra] = rb
-
-        # Union nodes connected by resolved edges.
-        for edge in self.resolved_edges:
-            caller_idx = node_to_idx.get(id(edge.caller))
-            callee_idx = node_to_idx.get(id(edge.resolved_callee))
+            if ra == rb:
+                return
+            if rank[ra] < rank[rb]:
+                ra, rb = rb, ra
+            parent[rb] = ra
+            if rank[ra] == rank[rb]:
+                rank[ra] += 1
+
+        n = len(self.nodes)
+        nodes = self.nodes
+
+        def idx_of(stamped: int, fn: FunctionNode) -> int | None:
+            # Trust the builder-stamped index when it matches this graph's
+            # node list (always true for the full graph); fall back to the
+            # dict for sub-graphs where indices refer to the parent.
+            if 0 <= stamped < n and nodes[stamped] is fn:
+                return stamped
+            return node_to_idx.get(id(fn))
+
+        # Union nodes connected by resolved edges (single pass over edges,
+        # skipping the intermediate resolved_edges list).
+        for edge in self.edges:
+            if edge.resolved_callee is None:
+                continue
+            caller_idx = idx_of(edge.caller_idx, edge.caller)
+            callee_idx = idx_of(edge.callee_idx, edge.resolved_callee)
             if caller_idx is not None and callee_idx is not None:
                 union(caller_idx, callee_idx)
 
-        # Group nodes by component root.
+        # Group nodes and edges by component root — one pass over each list
+        # instead of rescanning all edges per component.
         from collections import defaultdict
         components: dict[int, list[int]] = defaultdict(list)
         for i in range(len(self.nodes)):
             components[find(i)].append(i)
 
+        edges_by_root: dict[int, list[CallEdge]] = defaultdict(list)
+        for edge in self.edges:
+            caller_idx = idx_of(edge.caller_idx, edge.caller)
+            if caller_idx is not None:
+                edges_by_root[find(caller_idx)].append(edge)
+
         # Build sub-graphs.
         result: list[CallGraph] = []
-        for indices in components.values():
-            idx_set = set(indices)
+        for root, indices in components.items():
             comp_nodes = [self.nodes[i] for i in indices]
-            node_ids = {id(n) for n in comp_nodes}
-            comp_edges = [
-                e for e in self.edges
-                if id(e.caller) in node_ids
-            ]
-            result.append(CallGraph(nodes=comp_nodes, edges=comp_edges))
+            result.append(CallGraph(nodes=comp_nodes, edges=edges_by_root.get(root, [])))
 
         # Sort largest component first.
         result.sort(key=lambda g: len(g.nodes), reverse=True)
+        self._components = result
         return result
 
@@ -24,6 +24,16 @@ class BaseParser(ABC):
         """
         ...
 
+    @classmethod
+    def quick_reject(cls, source: bytes) -> bool:
+        """Return ``True`` if *source* certainly contains nothing to index.
+
+        A cheap substring test on the raw bytes, letting the scanner skip the
+        full parse for files with no definitions (generated files, re-export
+        stubs, …).  The default accepts everything.
+        """
+        return False
+
     @abstractmethod
     def parse(self, file_path: Path, source: str) -> ParseResult:
         """Parse *source* and return extracted functions and calls.
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +19,33 @@ except ImportError:
     pass
 
 
+# Path-separator → dot translation for module prefixes, built once.
+_PATH_TO_MODULE = str.maketrans({"/": ".", "\\": "."})
+
+# JSDoc cleanup patterns, compiled once — _extract_jsdoc runs per function.
+_JSDOC_DELIM_RE = re.compile(r"/\*\*|\*/")
+_JSDOC_LINE_RE = re.compile(r"^\s*\*\s?", re.MULTILINE)
+
+# Node types that define a named function (checked per node in the walk loop).
+_FN_DECL_TYPES = frozenset((
+    "function_declaration",
+    "method_definition",
+    "generator_function_declaration",
+))
+
+# Query matching only the node kinds we extract. Letting tree-sitter's C code
+# find them means Python touches O(matches) nodes instead of every node in
+# the tree.
+_QUERY_SOURCE = """
+(function_declaration) @fn
+(generator_function_declaration) @fn
+(method_definition) @fn
+(variable_declarator) @decl
+(class_declaration) @class
+(call_expression) @call
+"""
+
+
 class JSTypeScriptParser(BaseParser):
     """Parses JavaScript and TypeScript files using ``tree-sitter``."""
 
@@ -28,9 +56,30 @@ class JSTypeScriptParser(BaseParser):
         "tsx": "typescript",
     }
 
+    # Per-process caches — get_language/get_parser reload the grammar's shared
+    # object on every call, which is pure waste when parsing many files.
+    _LANG_CACHE: dict[str, Any] = {}
+    _PARSER_CACHE: dict[str, Any] = {}
+    _QUERY_CACHE: dict[str, Any] = {}
+
     def supported_extensions(self) -> list[str]:
         return ["js", "jsx", "ts", "tsx"]
 
+    @classmethod
+    def quick_reject(cls, source: bytes) -> bool:
+        """Skip the tree-sitter parse for files with no function-like syntax.
+
+        Object-literal shorthand methods (``{ handleRequest(req) { … } }``)
+        carry no ``function``/``=>``/``class`` marker, so also require the
+        absence of ``(`` — only pure data/config files can be rejected.
+        """
+        return (
+            b"function" not in source
+            and b"=>" not in source
+            and b"class " not in source
+            and b"(" not in source
+        )
+
     def parse(self, file_path: Path, source: str) -> ParseResult:
         if not _TREE_SITTER_AVAILABLE:
             return ParseResult(file_path=file_path)
@@ -39,8 +88,12 @@ class JSTypeScriptParser(BaseParser):
         lang_name = self._LANG_MAP.get(ext, "javascript")
 
         try:
-            language = get_language(lang_name)
-            parser = get_parser(lang_name)
+            language = self._LANG_CACHE.get(lang_name)
+            if language is None:
+                language = self._LANG_CACHE[lang_name] = get_language(lang_name)
+            parser = self._PARSER_CACHE.get(lang_name)
+            if parser is None:
+                parser = self._PARSER_CACHE[lang_name] = get_parser(lang_name)
         except Exception:
             return ParseResult(file_path=file_path)
 
@@ -50,80 +103,194 @@ class JSTypeScriptParser(BaseParser):
         functions: list[FunctionNode] = []
         calls: list[CallEdge] = []
 
-        self._walk_tree(root, file_path, source, functions, calls, scope_stack=[], current_fn=None)
+        # Module prefix for qualified names, computed once per file.
+        module = str(file_path).translate(_PATH_TO_MODULE)
+        for suffix in (".js", ".jsx", ".ts", ".tsx"):
+            if module.endswith(suffix):
+                module = module[: -len(suffix)]
+                break
+
+        query = self._QUERY_CACHE.get(lang_name)
+        if query is None and lang_name not in self._QUERY_CACHE:
+            try:
+                query = language.query(_QUERY_SOURCE)
+            except Exception:
+                query = None
+            self._QUERY_CACHE[lang_name] = query
+
+        if query is not None:
+            self._scan_captures(query, root, file_path, source, functions, calls, module + ".")
+        else:
+            # Query construction failed for this grammar — full Python walk.
+            self._walk_tree(root, file_path, source, functions, calls, module + ".")
 
         return ParseResult(file_path=file_path, functions=functions, calls=calls)
 
+    def _scan_captures(
+        self,
+        query: Any,
+        root: Any,
+        file_path: Path,
+        source: str,
+        functions: list[FunctionNode],
+        calls: list[CallEdge],
+        module_prefix: str,
+    ) -> None:
+        """Extract functions and calls from the query's capture list.
+
+        Scope context (qualified-name prefix, enclosing class, enclosing
+        function) is reconstructed from byte ranges: captures are processed
+        in document order against a stack of still-open scopes.
+        """
+        captures = query.captures(root)
+        captures.sort(key=lambda cap: cap[0].start_byte)
+
+        # Each open scope: (end_byte, prefix, class_name, current_fn).
+        scopes: list[tuple[int, str, str | None, FunctionNode | None]] = []
+
+        for node, capture_name in captures:
+            start = node.start_byte
+            while scopes and scopes[-1][0] <= start:
+                scopes.pop()
+            if scopes:
+                _, prefix, class_name, current_fn = scopes[-1]
+            else:
+                prefix, class_name, current_fn = module_prefix, None, None
+
+            if capture_name == "call":
+                if current_fn is not None:
+                    callee_name = self._extract_callee(node)
+                    if callee_name:
+                        calls.append(
+                            CallEdge(
+                                caller=current_fn,
+                                callee_name=sys.intern(callee_name),
+                                file_path=file_path,
+                                line_number=node.start_point[0] + 1,
+                            )
+                        )
+
+            elif capture_name == "fn":
+                fn_node = self._extract_function(node, file_path, source, prefix, class_name)
+                if fn_node:
+                    functions.append(fn_node)
+                    scopes.append((node.end_byte, prefix + fn_node.name + ".", None, fn_node))
+
+            elif capture_name == "decl":
+                # Arrow functions: `const foo = () => { ... }`
+                fn_child = self._find_child_type(node, ("arrow_function", "function_expression", "function"))
+                if fn_child is not None:
+                    name_node = node.child_by_field_name("name")
+                    if name_node:
+                        fn_node = self._make_fn_node(
+                            name_node.text.decode("utf-8"),
+                            node,
+                            fn_child,
+                            file_path,
+                            source,
+                            prefix,
+                            class_name,
+                        )
+                        if fn_node:
+                            functions.append(fn_node)
+                            scopes.append((node.end_byte, prefix + fn_node.name + ".", None, fn_node))
+
+            elif capture_name == "class":
+                name_node = node.child_by_field_name("name")
+                cls = name_node.text.decode("utf-8") if name_node else "<anon_class>"
+                scopes.append((node.end_byte, prefix + cls + ".", cls, current_fn))
+
     # ------------------------------------------------------------------
     # Tree walking
     # ------------------------------------------------------------------
 
     def _walk_tree(
         self,
-        node: Any,
+        root: Any,
         file_path: Path,
         source: str,
         functions: list[FunctionNode],
         calls: list[CallEdge],
-        scope_stack: list[str],
-        current_fn: FunctionNode | None,
+        module_prefix: str,
     ) -> None:
-        fn_node: FunctionNode | None = None
-
-        # ---- Function / method definitions ----
-        if node.type in (
-            "function_declaration",
-            "method_definition",
-            "generator_function_declaration",
-        ):
-            fn_node = self._extract_function(node, file_path, source, scope_stack)
-            if fn_node:
-                functions.append(fn_node)
+        # Explicit-stack pre-order walk: avoids a Python frame per tree-sitter
+        # node and the O(depth) scope-list copies of the recursive version.
+        # Instead of a scope stack, each frame carries the ready-made
+        # qualified-name prefix (extended once on scope entry) plus the
+        # enclosing class name, so building a qualified name is O(1).
+        extract_function = self._extract_function
+        extract_callee = self._extract_callee
+
+        stack: list[tuple[Any, str, str | None, FunctionNode | None]] = [
+            (root, module_prefix, None, None)
+        ]
+        while stack:
+            node, prefix, class_name, current_fn = stack.pop()
+            node_type = node.type
+            fn_node: FunctionNode | None = None
+
+            # ---- Function / method definitions ----
+            if node_type in _FN_DECL_TYPES:
+                fn_node = extract_function(node, file_path, source, prefix, class_name)
+                if fn_node:
+                    functions.append(fn_node)
+
+            elif node_type == "variable_declarator":
+                # Arrow functions: `const foo = () => { ... }`
+                fn_child = self._find_child_type(node, ("arrow_function", "function_expression", "function"))
+                if fn_child is not None:
+                    name_node = node.child_by_field_name("name")
+                    if name_node:
+                        fn_node = self._make_fn_node(
+                            name_node.text.decode("utf-8"),
+                            node,
+                            fn_child,
+                            file_path,
+                            source,
+                            prefix,
+                            class_name,
+                        )
+                        if fn_node:
+                            functions.append(fn_node)
+
+            # ---- Call expressions ----
+            elif node_type == "call_expression" and current_fn is not None:
+                callee_name = extract_callee(node)
+                if callee_name:
+                    calls.append(
+                        CallEdge(
+                            caller=current_fn,
+                            # Callee names repeat heavily (console.log, …);
+                            # interning dedups the strings and makes the
+                            # resolver's dict lookups pointer-comparisons.
+                            callee_name=sys.intern(callee_name),
+                            file_path=file_path,
+                            line_number=node.start_point[0] + 1,
+                        )
+                    )
 
-        elif node.type == "variable_declarator":
-            # Arrow functions: `const foo = () => { ... }`
-            fn_child = self._find_child_type(node, ("arrow_function", "function_expression", "function"))
-            if fn_child is not None:
+            # ---- Class definitions ----
+            if node_type == "class_declaration":
                 name_node = node.child_by_field_name("name")
-                if name_node:
-                    fn_node = self._make_fn_node(
-                        name_node.text.decode("utf-8"),
-                        node,
-                        fn_child,
-                        file_path,
-                        source,
-                        scope_stack,
-                    )
-                    if fn_node:
-                        functions.append(fn_node)
-
-        # ---- Call expressions ----
-        elif node.type == "call_expression" and current_fn is not None:
-            callee_name = self._extract_callee(node)
-            if callee_name:
-                calls.append(
-                    CallEdge(
-                        caller=current_fn,
-                        callee_name=callee_name,
-                        file_path=file_path,
-                        line_number=node.start_point[0] + 1,
-                    )
-                )
-
-        # ---- Class definitions ----
-        if node.type == "class_declaration":
-            name_node = node.child_by_field_name("name")
-            class_name = name_node.text.decode("utf-8") if name_node else "<anon_class>"
-            new_scope = scope_stack + [class_name]
-            for child in node.children:
-                self._walk_tree(child, file_path, source, functions, calls, new_scope, current_fn)
-            return
-
-        # Recurse
-        active_fn = fn_node or current_fn
-        new_scope = scope_stack + [fn_node.name] if fn_node else scope_stack
-        for child in node.children:
-            self._walk_tree(child, file_path, source, functions, calls, new_scope, active_fn)
+                cls = name_node.text.decode("utf-8") if name_node else "<anon_class>"
+                new_prefix = prefix + cls + "."
+                for child in reversed(node.children):
+                    stack.append((child, new_prefix, cls, current_fn))
+                continue
+
+            # Descend (reversed push preserves left-to-right visit order).
+            # Entering a function scope extends the prefix and clears the
+            # class context — definitions nested in a body aren't methods.
+            if fn_node:
+                active_fn = fn_node
+                new_prefix = prefix + fn_node.name + "."
+                child_class: str | None = None
+            else:
+                active_fn = current_fn
+                new_prefix = prefix
+                child_class = class_name
+            for child in reversed(node.children):
+                stack.append((child, new_prefix, child_class, active_fn))
 
     # ------------------------------------------------------------------
     # Helpers
@@ -134,13 +301,14 @@ class JSTypeScriptParser(BaseParser):
         node: Any,
         file_path: Path,
         source: str,
-        scope_stack: list[str],
+        prefix: str,
+        class_name: str | None,
     ) -> FunctionNode | None:
         name_node = node.child_by_field_name("name")
         if name_node is None:
             return None
         name = name_node.text.decode("utf-8")
-        return self._make_fn_node(name, node, node, file_path, source, scope_stack)
+        return self._make_fn_node(name, node, node, file_path, source, prefix, class_name)
 
     def _make_fn_node(
         self,
@@ -149,18 +317,14 @@ class JSTypeScriptParser(BaseParser):
         body_node: Any,
         file_path: Path,
         source: str,
-        scope_stack: list[str],
+        prefix: str,
+        class_name: str | None,
     ) -> FunctionNode:
-        module = str(file_path).replace("/", ".").replace("\\", ".")
-        for ext in (".js", ".jsx", ".ts", ".tsx"):
-            if module.endswith(ext):
-                module = module[: -len(ext)]
-                break
-        parts = [module] + list(scope_stack) + [name]
-        qualified = ".".join(parts)
-
-        # Determine class context
-        class_name = scope_stack[-1] if scope_stack else None
+        # Intern the identifying strings — names repeat heavily across a
+        # codebase and interned keys hit dict fast paths downstream.
+        name = sys.intern(name)
+        qualified = sys.intern(prefix + name)
+        class_name = sys.intern(class_name) if class_name else None
 
         # Extract parameters
         params = self._extract_params(body_node)
@@ -203,9 +367,13 @@ class JSTypeScriptParser(BaseParser):
         if prev is not None and prev.type == "comment":
             text = prev.text.decode("utf-8").strip()
             if text.startswith("/**"):
-                # Clean up JSDoc to a plain string.
-                cleaned = re.sub(r"/\*\*|\*/", "", text)
-                cleaned = re.sub(r"^\s*\*\s?", "", cleaned, flags=re.MULTILINE)
+                # Clean up JSDoc to a plain string. Single-line comments with
+                # no continuation asterisks don't need the regexes at all.
+                inner = text[3:-2]
+                if "*" not in inner:
+                    return inner.strip() or None
+                cleaned = _JSDOC_DELIM_RE.sub("", text)
+                cleaned = _JSDOC_LINE_RE.sub("", cleaned)
                 return cleaned.strip() or None
         return None
 
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import os
 import re
 import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+# Compiled once — re's internal cache is bounded and can be evicted.
+_MERMAID_BLOCK_RE = re.compile(r"```mermaid\s*\n(.*?)```", re.DOTALL)
+
+
 def mmdc_available() -> bool:
     """Return True if the ``mmdc`` command is on PATH."""
     return shutil.which("mmdc") is not None
@@ -17,7 +23,7 @@ def mmdc_available() -> bool:
 def _extract_mermaid(md_path: Path) -> str:
     """Extract the raw Mermaid code block from a Markdown file."""
     text = md_path.read_text(encoding="utf-8")
-    match = re.search(r"```mermaid\s*\n(.*?)```", text, re.DOTALL)
+    match = _MERMAID_BLOCK_RE.search(text)
     if not match:
         raise ValueError(f"No mermaid code block found in {md_path}")
     return match.group(1)
@@ -98,13 +104,26 @@ def export_pngs_from_dir(
     md_dir: Path,
     width: int = 1920,
     height: int = 1080,
+    jobs: int | None = None,
 ) -> list[Path]:
     """Convert all component Markdown files in a directory to PNG.
 
-    Skips ``index.md``. Returns paths of generated PNGs.
+    Skips ``index.md``. Returns paths of generated PNGs in file order.
+
+    Each conversion spawns an ``mmdc`` Node process, so the work is run on a
+    thread pool — *jobs* wide, defaulting to the CPU count capped at 8 to
+    avoid overwhelming the machine with Node startups.
     """
-    pngs: list[Path] = []
-    for md_file in sorted(md_dir.glob("component_*.md")):
-        png = export_png(md_file, width=width, height=height)
-        pngs.append(png)
-    return pngs
+    md_files = sorted(md_dir.glob("component_*.md"))
+    if jobs is None:
+        jobs = min(os.cpu_count() or 1, 8)
+
+    if jobs <= 1 or len(md_files) <= 1:
+        return [export_png(f, width=width, height=height) for f in md_files]
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(export_png, f, width=width, height=height)
+            for f in md_files
+        ]
+        return [future.result() for future in futures]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import hashlib
+import io
 import re
 from collections import defaultdict
 from pathlib import Path
@@ -10,25 +11,56 @@ from pathlib import Path
 from codesleuth.models import CallGraph, FunctionNode
 from codesleuth.renderers.base_renderer import BaseRenderer
 
+# Compiled once — _subgraph_id runs per file in every rendered diagram.
+_UNSAFE_ID_RE = re.compile(r"[^a-zA-Z0-9_]")
+
+# Mermaid-breaking characters → entities, applied in one translate pass.
+_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    '"': "&quot;",
+    "<": "&lt;",
+    ">": "&gt;",
+})
+
 
 class MermaidRenderer(BaseRenderer):
     """Renders a :class:`CallGraph` as a Mermaid flowchart inside a Markdown file."""
 
     def render(self, graph: CallGraph, output_path: Path, **options) -> None:
-        """Write the Mermaid diagram to *output_path* (single file mode)."""
+        """Write the Mermaid diagram to *output_path* (single file mode).
+
+        Streams straight into the file instead of materializing the whole
+        markdown string (plus its UTF-8 encoding) in memory first.
+        """
+        direction: str = options.get("direction", "TD")
+        max_doc: int = options.get("max_docstring_length", 80)
+        include_orphans: bool = options.get("include_orphans", False)
+
+        with output_path.open("w", encoding="utf-8") as f:
+            f.write(self._markdown_header("Call Graph"))
+            self._build_diagram_into(f.write, graph, direction, max_doc, include_orphans)
+            f.write("\n```\n")
+
+    def render_to_string(self, graph: CallGraph, **options) -> str:
+        """Render the full markdown document as a string (no file I/O).
+
+        Takes the same options as :meth:`render`.
+        """
         direction: str = options.get("direction", "TD")
         max_doc: int = options.get("max_docstring_length", 80)
         include_orphans: bool = options.get("include_orphans", False)
 
-        lines = self._build_diagram(graph, direction, max_doc, include_orphans)
-        markdown = self._wrap_markdown(lines, title="Call Graph")
-        output_path.write_text(markdown, encoding="utf-8")
+        diagram = self._build_diagram(graph, direction, max_doc, include_orphans)
+        return self._wrap_markdown(diagram, title="Call Graph")
 
-    def render_components(self, graph: CallGraph, output_dir: Path, **options) -> list[Path]:
+    def render_components(
+        self, graph: CallGraph, output_dir: Path, **options
+    ) -> tuple[Path, list[Path]]:
         """Split *graph* into connected components and write each to a separate file.
 
-        Creates *output_dir* if it doesn't exist.  Returns the list of files
-        written (including the index).
+        Creates *output_dir* if it doesn't exist.  Returns
+        ``(index_path, component_paths)`` so callers don't have to pick the
+        index back out of a flat list.
 
         Parameters
         ----------
@@ -46,7 +78,7 @@ class MermaidRenderer(BaseRenderer):
         output_dir.mkdir(parents=True, exist_ok=True)
 
         components = graph.connected_components()
-        written: list[Path] = []
+        component_paths: list[Path] = []
 
         # Collect metadata for the index.
         component_info: list[dict] = []
@@ -56,7 +88,7 @@ class MermaidRenderer(BaseRenderer):
             if not include_orphans and not comp.resolved_edges:
                 continue
 
-            lines = self._build_diagram(comp, direction, max_doc, include_orphans)
+            diagram = self._build_diagram(comp, direction, max_doc, include_orphans)
 
             # Determine a human-friendly name from the files involved.
             files_in_comp = sorted({str(fn.file_path) for fn in comp.nodes})
@@ -64,11 +96,11 @@ class MermaidRenderer(BaseRenderer):
             filename = f"component_{idx:02d}_{comp_name}.md"
 
             title = f"Component {idx} — {comp_name}"
-            markdown = self._wrap_markdown(lines, title=title)
+            markdown = self._wrap_markdown(diagram, title=title)
 
             out_path = output_dir / filename
             out_path.write_text(markdown, encoding="utf-8")
-            written.append(out_path)
+            component_paths.append(out_path)
 
             component_info.append({
                 "index": idx,
@@ -83,9 +115,8 @@ class MermaidRenderer(BaseRenderer):
         index_path = output_dir / "index.md"
         index_md = self._build_index(component_info)
         index_path.write_text(index_md, encoding="utf-8")
-        written.insert(0, index_path)
 
-        return written
+        return index_path, component_paths
 
     @staticmethod
     def _component_name(idx: int, files: list[str]) -> str:
@@ -121,9 +152,9 @@ class MermaidRenderer(BaseRenderer):
     # Node ID generation — short IDs to keep diagram text small
     # ------------------------------------------------------------------
 
-    def _make_id_map(self, nodes: list[FunctionNode]) -> dict[str, str]:
-        """Create a mapping from FunctionNode hash-key to a short id like ``n0``, ``n1``."""
-        id_map: dict[str, str] = {}
+    def _make_id_map(self, nodes: list[FunctionNode]) -> dict[tuple[Path, str, int], str]:
+        """Create a mapping from FunctionNode key to a short id like ``n0``, ``n1``."""
+        id_map: dict[tuple[Path, str, int], str] = {}
         for i, fn in enumerate(nodes):
             key = self._fn_key(fn)
             if key not in id_map:
@@ -131,16 +162,24 @@ class MermaidRenderer(BaseRenderer):
         return id_map
 
     @staticmethod
-    def _fn_key(fn: FunctionNode) -> str:
-        """Stable hash key for a FunctionNode."""
-        return f"{fn.file_path}::{fn.qualified_name}::{fn.line_number}"
+    def _fn_key(fn: FunctionNode) -> tuple[Path, str, int]:
+        """Stable key for a FunctionNode.
+
+        A tuple of existing attributes — hashing it reuses the components'
+        cached hashes instead of building and hashing a fresh string per use.
+        """
+        return (fn.file_path, fn.qualified_name, fn.line_number)
 
     # ------------------------------------------------------------------
     # Labels — compact but informative
     # ------------------------------------------------------------------
 
-    def _node_label(self, fn: FunctionNode, max_doc: int) -> str:
-        """Build a compact label: name, location, and optional short docstring."""
+    def _node_label(self, fn: FunctionNode, max_doc: int, fname: str) -> str:
+        """Build a compact label: name, location, and optional short docstring.
+
+        *fname* is the file's basename, computed once per file by the caller
+        rather than via a fresh ``Path`` per node.
+        """
         parts: list[str] = []
 
         # Function name (bold)
@@ -150,7 +189,6 @@ class MermaidRenderer(BaseRenderer):
         parts.append(f"<b>{self._escape(display_name)}</b>")
 
         # File:line (compact)
-        fname = Path(fn.file_path).name
         parts.append(f"<i>{self._escape(fname)}:{fn.line_number}</i>")
 
         # Docstring excerpt (short)
@@ -169,10 +207,14 @@ class MermaidRenderer(BaseRenderer):
 
     @staticmethod
     def _subgraph_id(file_path: Path) -> str:
-        """Short, deterministic subgraph id from a file path."""
-        h = hashlib.md5(str(file_path).encode()).hexdigest()[:6]
+        """Short, deterministic subgraph id from a file path.
+
+        blake2s is faster than md5 here and, unlike md5, exists on
+        FIPS-restricted builds.
+        """
+        h = hashlib.blake2s(str(file_path).encode(), digest_size=3).hexdigest()
         name = Path(file_path).stem
-        safe = re.sub(r"[^a-zA-Z0-9_]", "_", name)
+        safe = _UNSAFE_ID_RE.sub("_", name)
         return f"sg_{safe}_{h}"
 
     # ------------------------------------------------------------------
@@ -185,11 +227,28 @@ class MermaidRenderer(BaseRenderer):
         direction: str,
         max_doc: int,
         include_orphans: bool,
-    ) -> list[str]:
-        lines: list[str] = [f"flowchart {direction}"]
+    ) -> str:
+        """Build the diagram as a string (for callers that need one)."""
+        buf = io.StringIO()
+        self._build_diagram_into(buf.write, graph, direction, max_doc, include_orphans)
+        return buf.getvalue()
+
+    def _build_diagram_into(
+        self,
+        w,
+        graph: CallGraph,
+        direction: str,
+        max_doc: int,
+        include_orphans: bool,
+    ) -> None:
+        # Emit through the writer callable: per-node/per-edge f-strings plus
+        # a final join created thousands of short-lived strings on big graphs,
+        # and a writer lets render stream to disk without a full buffer.
+        w("flowchart ")
+        w(direction)
 
         # Determine which nodes to include.
-        connected_keys: set[str] = set()
+        connected_keys: set[tuple[Path, str, int]] = set()
         for edge in graph.resolved_edges:
             connected_keys.add(self._fn_key(edge.caller))
             connected_keys.add(self._fn_key(edge.resolved_callee))  # type: ignore[arg-type]
@@ -199,8 +258,8 @@ class MermaidRenderer(BaseRenderer):
         ]
 
         if not nodes_to_render:
-            lines.append("    NoNodes[\"No call relationships detected\"]")
-            return lines
+            w("\n    NoNodes[\"No call relationships detected\"]")
+            return
 
         # Build short-ID mapping.
         id_map = self._make_id_map(nodes_to_render)
@@ -213,31 +272,42 @@ class MermaidRenderer(BaseRenderer):
         # Render subgraphs.
         for file_path in sorted(by_file.keys()):
             fns = by_file[file_path]
+            fname = file_path.name
             sg_id = self._subgraph_id(file_path)
             sg_label = self._escape(str(file_path))
-            lines.append(f"    subgraph {sg_id}[\"{sg_label}\"]")
+            w("\n    subgraph ")
+            w(sg_id)
+            w("[\"")
+            w(sg_label)
+            w("\"]")
             for fn in sorted(fns, key=lambda f: f.line_number):
-                nid = id_map[self._fn_key(fn)]
-                label = self._node_label(fn, max_doc)
-                lines.append(f"        {nid}[\"{label}\"]")
-            lines.append("    end")
+                w("\n        ")
+                w(id_map[self._fn_key(fn)])
+                w("[\"")
+                w(self._node_label(fn, max_doc, fname))
+                w("\"]")
+            w("\n    end")
 
         # Render edges.
         for edge in graph.resolved_edges:
             src = id_map.get(self._fn_key(edge.caller))
             dst = id_map.get(self._fn_key(edge.resolved_callee))  # type: ignore[arg-type]
             if src and dst:
-                lines.append(f"    {src} -->|L{edge.line_number}| {dst}")
-
-        return lines
+                w("\n    ")
+                w(src)
+                w(" -->|L")
+                w(str(edge.line_number))
+                w("| ")
+                w(dst)
 
     # ------------------------------------------------------------------
     # Markdown wrapper
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _wrap_markdown(diagram_lines: list[str], title: str = "Call Graph") -> str:
-        body = "\n".join(diagram_lines)
+    def _markdown_header(title: str) -> str:
+        """Everything that precedes the diagram body, ending after the init
+        directive's newline."""
         # Set maxTextSize high enough for large codebases.
         init_directive = (
             "%%{init: {"
@@ -251,10 +321,12 @@ class MermaidRenderer(BaseRenderer):
             "_Auto-generated by [CodeSleuth](https://github.com/codesleuth)._\n\n"
             "```mermaid\n"
             f"{init_directive}\n"
-            f"{body}\n"
-            "```\n"
         )
 
+    @staticmethod
+    def _wrap_markdown(body: str, title: str = "Call Graph") -> str:
+        return MermaidRenderer._markdown_header(title) + body + "\n```\n"
+
     # ------------------------------------------------------------------
     # Sanitisation
     # ------------------------------------------------------------------
@@ -262,9 +334,6 @@ class MermaidRenderer(BaseRenderer):
     @staticmethod
     def _escape(text: str) -> str:
         """Escape characters that break Mermaid syntax."""
-        return (
-            text.replace("&", "&amp;")
-            .replace('"', "&quot;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-        )
+        # One C-level pass instead of four chained replace scans; translate
+        # maps characters, so replacement text is never itself re-escaped.
+        return text.translate(_ESCAPE_TABLE)
@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import fnmatch
+import itertools
+import operator
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Iterable, Iterator
 
 import pathspec  # type: ignore[import-untyped]
 
+from codesleuth.cache import ParseCache
 from codesleuth.models import ParseResult
+from codesleuth.parsers.base_parser import BaseParser
 from codesleuth.parsers.registry import ParserRegistry
 
 # Directories that are *always* skipped regardless of .gitignore.
@@ -25,8 +35,71 @@ _ALWAYS_SKIP: set[str] = {
     "build",
     ".eggs",
     "*.egg-info",
+    ".codesleuth_cache",
 }
 
+# Below this many files a process pool costs more to start than it saves.
+_MIN_FILES_FOR_POOL = 8
+
+# Read-ahead window for the serial path: reads release the GIL, so a few I/O
+# threads keep bytes flowing while the main thread parses.
+_READ_PREFETCH = 8
+_READ_THREADS = 4
+
+# Per-worker registry, built once by the pool initializer so parser instances
+# never have to be pickled across the process boundary.
+_WORKER_REGISTRY: ParserRegistry | None = None
+
+
+def _init_worker(registry_factory: Callable[[], ParserRegistry]) -> None:
+    """Pool initializer — build a fresh registry inside each worker process."""
+    global _WORKER_REGISTRY
+    _WORKER_REGISTRY = registry_factory()
+
+
+def _parse_one(task: tuple[str, str, str]) -> ParseResult:
+    """Read and parse a single file inside a worker process.
+
+    *task* is ``(absolute_path, relative_path, extension)``.  Reading happens
+    in the worker so only small strings cross the process boundary.
+    """
+    abs_path, rel_path, ext = task
+    assert _WORKER_REGISTRY is not None  # set by _init_worker
+    parser = _WORKER_REGISTRY.get_parser(ext)
+    if parser is None:
+        return ParseResult(file_path=_pooled_path(rel_path))
+    return _parse_bytes(parser, rel_path, _read_bytes(abs_path))
+
+
+# Pool of relative-path objects, keyed by string. Every node and edge for a
+# file shares the one Path the parser was handed, so pooling here makes path
+# identity hold process-wide (dict keys on paths hash once, and id()-based
+# fast paths stay valid across cache loads and repeated scans).
+_PATH_POOL: dict[str, Path] = {}
+
+
+def _pooled_path(path_str: str) -> Path:
+    path = _PATH_POOL.get(path_str)
+    if path is None:
+        path = _PATH_POOL[path_str] = Path(path_str)
+    return path
+
+
+def _read_bytes(abs_path: str) -> bytes | None:
+    """Read a file's raw bytes, or ``None`` if it can't be read."""
+    try:
+        return Path(abs_path).read_bytes()
+    except OSError:
+        return None
+
+
+def _parse_bytes(parser: BaseParser, rel_path: str, raw: bytes | None) -> ParseResult:
+    """Apply the parser's quick-reject filter, then decode and parse."""
+    if raw is None or parser.quick_reject(raw):
+        return ParseResult(file_path=_pooled_path(rel_path))
+    source = raw.decode("utf-8", errors="replace")
+    return parser.parse(_pooled_path(rel_path), source)
+
 
 class FileScanner:
     """Recursively scans a directory tree and parses supported source files."""
@@ -36,66 +109,175 @@ class FileScanner:
         root: Path,
         registry: ParserRegistry,
         extra_excludes: list[str] | None = None,
+        registry_factory: Callable[[], ParserRegistry] | None = None,
+        cache_dir: Path | None = None,
     ) -> None:
         self.root = root.resolve()
+        # Root prefix for deriving relative paths by string slicing — much
+        # cheaper than Path.relative_to's per-file parts comparison.
+        self._root_prefix = os.fspath(self.root) + os.sep
         self.registry = registry
         self._gitignore_spec = self._load_gitignore()
         self._extra_excludes = extra_excludes or []
+        # Precompiled exclude patterns: Path.match re-translates its pattern
+        # on every call, which multiplies out to patterns x files fnmatch
+        # compiles per scan. Each entry keeps the pattern's component count
+        # so matching still applies to the path's tail, like Path.match.
+        self._extra_exclude_res = [
+            (pattern.count("/") + 1, re.compile(fnmatch.translate(pattern)))
+            for pattern in self._extra_excludes
+        ]
+        # Picklable factory for worker processes (parallel scans only).
+        self._registry_factory = registry_factory
+        self._cache = ParseCache(cache_dir) if cache_dir is not None else None
 
     # ------------------------------------------------------------------
     # Public
     # ------------------------------------------------------------------
 
-    def scan(self) -> list[ParseResult]:
-        """Walk the tree, parse each supported file, and return results."""
-        results: list[ParseResult] = []
+    def scan(self, workers: int | None = None) -> list[ParseResult]:
+        """Walk the tree, parse each supported file, and return results.
 
-        for file_path in self._iter_files():
-            ext = file_path.suffix.lstrip(".")
-            parser = self.registry.get_parser(ext)
-            if parser is None:
+        Parameters
+        ----------
+        workers:
+            Number of parser processes.  Defaults to the CPU count.  Parsing
+            runs serially when ``workers`` is 1, when the input is too small
+            to amortize pool startup, or when no ``registry_factory`` was
+            provided at construction.
+        """
+        tasks: list[tuple[str, str, str]] = []
+        for abs_path, rel_path in self._iter_files():
+            ext = rel_path.rpartition(".")[2]
+            if self.registry.get_parser(ext) is None:
                 continue
+            tasks.append((abs_path, rel_path, ext))
 
-            try:
-                source = file_path.read_text(encoding="utf-8", errors="replace")
-            except (OSError, UnicodeDecodeError):
-                continue
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        # Consult the on-disk cache; only misses are parsed.
+        cached: list[ParseResult] = []
+        task_keys: list[str | None] = []
+        if self._cache is not None:
+            pending: list[tuple[str, str, str]] = []
+            for task in tasks:
+                key = ParseCache.key_for(task[0])
+                hit = self._cache.get(key) if key else None
+                if hit is not None:
+                    cached.append(hit)
+                else:
+                    pending.append(task)
+                    task_keys.append(key)
+            tasks = pending
+
+        if (
+            workers <= 1
+            or len(tasks) < _MIN_FILES_FOR_POOL
+            or self._registry_factory is None
+        ):
+            results = list(self._parse_pipelined(tasks))
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self._registry_factory,),
+            ) as executor:
+                results = list(executor.map(_parse_one, tasks, chunksize=16))
 
-            rel_path = file_path.relative_to(self.root)
-            result = parser.parse(rel_path, source)
-            if result.functions or result.calls:
-                results.append(result)
+        if self._cache is not None:
+            for key, result in zip(task_keys, results):
+                if key:
+                    self._cache.put(key, result)
+            results = cached + results
 
-        return results
+        return [r for r in results if r.functions or r.calls]
+
+    # ------------------------------------------------------------------
+    # Parsing
+    # ------------------------------------------------------------------
+
+    def _parse_pipelined(self, tasks: Iterable[tuple[str, str, str]]) -> Iterator[ParseResult]:
+        """Parse in-process, prefetching file reads on a small thread pool.
+
+        Reads release the GIL, so a bounded sliding window of in-flight reads
+        overlaps disk latency with CPU-bound parsing on the main thread. The
+        window (8 files ahead, 4 reader threads) is deliberately small: it
+        only needs to cover read latency, and a larger one would just buffer
+        file contents in memory. Parallel scans don't come through here —
+        pool workers read their own files.
+        """
+        with ThreadPoolExecutor(max_workers=_READ_THREADS) as io_pool:
+            it = iter(tasks)
+            window = deque(
+                (task, io_pool.submit(_read_bytes, task[0]))
+                for task in itertools.islice(it, _READ_PREFETCH)
+            )
+            while window:
+                task, future = window.popleft()
+                next_task = next(it, None)
+                if next_task is not None:
+                    window.append((next_task, io_pool.submit(_read_bytes, next_task[0])))
+                parser = self.registry.get_parser(task[2])
+                yield _parse_bytes(parser, task[1], future.result())
 
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
 
     def _iter_files(self):
-        """Yield all files under ``self.root`` that aren't excluded."""
-        for path in sorted(self.root.rglob("*")):
-            if not path.is_file():
-                continue
-            rel = path.relative_to(self.root)
-            if self._is_excluded(rel):
+        """Yield ``(absolute, relative)`` path strings for supported files.
+
+        An ``os.scandir`` walk that prunes excluded directories outright —
+        ``rglob`` stats every file inside ``.venv``/``node_modules`` before
+        filtering, and sorting the materialized tree held it all in memory.
+        Entries are instead sorted per directory, which keeps the overall
+        order deterministic (and identical to the old global sort). Relative
+        paths come from slicing off the root prefix; no Path objects are
+        built during the walk.
+        """
+        yield from self._walk_dir(os.fspath(self.root), self.registry.supported_extensions)
+
+    def _walk_dir(self, dirpath: str, supported: set[str]):
+        try:
+            with os.scandir(dirpath) as it:
+                entries = sorted(it, key=operator.attrgetter("name"))
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in _ALWAYS_SKIP:
+                        continue
+                    # Evaluate gitignore once per directory and prune, rather
+                    # than re-matching the directory part for every file in it.
+                    if self._gitignore_spec is not None:
+                        rel_dir = entry.path.removeprefix(self._root_prefix)
+                        if self._gitignore_spec.match_file(rel_dir + "/"):
+                            continue
+                    yield from self._walk_dir(entry.path, supported)
+                elif entry.is_file(follow_symlinks=False):
+                    # Cheap extension filter before any further work.
+                    if entry.name.rpartition(".")[2] not in supported:
+                        continue
+                    rel_str = entry.path.removeprefix(self._root_prefix)
+                    if not self._is_excluded(rel_str):
+                        yield entry.path, rel_str
+            except OSError:
                 continue
-            yield path
 
-    def _is_excluded(self, rel_path: Path) -> bool:
-        """Check if a path should be skipped."""
-        parts = rel_path.parts
+    def _is_excluded(self, rel_str: str) -> bool:
+        """Check if a relative path string should be skipped."""
+        parts = rel_str.split(os.sep)
 
         # Check always-skip directory names.
         for part in parts:
             if part in _ALWAYS_SKIP:
                 return True
 
-        rel_str = str(rel_path)
-
-        # Extra CLI excludes.
-        for pattern in self._extra_excludes:
-            if rel_path.match(pattern):
+        # Extra CLI excludes (tail-matched like Path.match, but precompiled).
+        for depth, regex in self._extra_exclude_res:
+            if regex.match("/".join(parts[-depth:])):
                 return True
 
         # .gitignore rules.
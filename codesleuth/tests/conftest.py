@@ -7,17 +7,17 @@ from pathlib import Path
 import pytest
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
     """Return the absolute path to the fixtures directory."""
     return Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def python_fixtures(fixtures_dir: Path) -> Path:
     return fixtures_dir / "sample_python"
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def js_fixtures(fixtures_dir: Path) -> Path:
     return fixtures_dir / "sample_js"
@@ -6,72 +6,93 @@ from pathlib import Path
 
 import pytest
 
-# tree-sitter may not be installed in CI — skip gracefully.
-try:
-    from tree_sitter_languages import get_language  # type: ignore[import-untyped]
-    _HAS_TREE_SITTER = True
-except ImportError:
-    _HAS_TREE_SITTER = False
+# tree-sitter may not be installed in CI — skip the whole module at import
+# so pytest doesn't even collect (or evaluate skip markers for) its tests.
+pytest.importorskip("tree_sitter_languages")
 
-from codesleuth.parsers.js_ts_parser import JSTypeScriptParser
+from codesleuth.parsers.js_ts_parser import JSTypeScriptParser  # noqa: E402
 
-pytestmark = pytest.mark.skipif(not _HAS_TREE_SITTER, reason="tree-sitter-languages not installed")
 
+# One parser for the whole session — constructing per test repeats the
+# tree-sitter language loading.
+@pytest.fixture(scope="session")
+def js_parser() -> JSTypeScriptParser:
+    return JSTypeScriptParser()
 
-class TestJSTypeScriptParser:
-    """Tests for :class:`JSTypeScriptParser`."""
 
-    def setup_method(self):
-        self.parser = JSTypeScriptParser()
+# Sources read and decoded once per session, separate from parsing so any
+# future test that needs the raw text shares the same read.
+@pytest.fixture(scope="session")
+def index_js_source(js_fixtures: Path) -> str:
+    return (js_fixtures / "index.js").read_text()
+
 
-    def test_supported_extensions(self):
-        assert set(self.parser.supported_extensions()) == {"js", "jsx", "ts", "tsx"}
+@pytest.fixture(scope="session")
+def helpers_js_source(js_fixtures: Path) -> str:
+    return (js_fixtures / "helpers.js").read_text()
 
-    def test_extracts_functions(self, js_fixtures: Path):
-        source = (js_fixtures / "index.js").read_text()
-        result = self.parser.parse(Path("index.js"), source)
 
-        names = [fn.name for fn in result.functions]
-        assert "greet" in names
-        assert "formatGreeting" in names
+# Parsed once per session — tree-sitter parsing dominates this module's
+# runtime, and the tests only read the results.
+@pytest.fixture(scope="session")
+def parsed_index_js(js_parser: JSTypeScriptParser, index_js_source: str):
+    return js_parser.parse(Path("index.js"), index_js_source)
 
-    def test_extracts_arrow_functions(self, js_fixtures: Path):
-        source = (js_fixtures / "index.js").read_text()
-        result = self.parser.parse(Path("index.js"), source)
 
-        names = [fn.name for fn in result.functions]
-        assert "processAndGreet" in names
+@pytest.fixture(scope="session")
+def parsed_helpers_js(js_parser: JSTypeScriptParser, helpers_js_source: str):
+    return js_parser.parse(Path("helpers.js"), helpers_js_source)
 
-    def test_extracts_class_methods(self, js_fixtures: Path):
-        source = (js_fixtures / "helpers.js").read_text()
-        result = self.parser.parse(Path("helpers.js"), source)
 
-        methods = [fn for fn in result.functions if fn.class_name == "MathHelper"]
-        method_names = [m.name for m in methods]
-        assert "add" in method_names
-        assert "addAndFormat" in method_names
+@pytest.fixture(scope="session")
+def index_js_fn_names(parsed_index_js) -> set[str]:
+    return {fn.name for fn in parsed_index_js.functions}
 
-    def test_extracts_jsdoc(self, js_fixtures: Path):
-        source = (js_fixtures / "index.js").read_text()
-        result = self.parser.parse(Path("index.js"), source)
 
-        greet_fn = next((fn for fn in result.functions if fn.name == "greet"), None)
+class TestJSTypeScriptParser:
+    """Tests for :class:`JSTypeScriptParser`."""
+
+    def test_supported_extensions(self, js_parser: JSTypeScriptParser):
+        assert set(js_parser.supported_extensions()) == {"js", "jsx", "ts", "tsx"}
+
+    def test_quick_reject(self):
+        """Files without function-like syntax are rejected; others are kept."""
+        assert JSTypeScriptParser.quick_reject(b"export const VERSION = '1.0';\n")
+        assert not JSTypeScriptParser.quick_reject(b"function foo() {}\n")
+        assert not JSTypeScriptParser.quick_reject(b"const f = () => 1;\n")
+        # Object-literal shorthand methods must never be rejected.
+        assert not JSTypeScriptParser.quick_reject(
+            b"module.exports = { handleRequest(req) { return req.id; } };\n"
+        )
+
+    @pytest.mark.parametrize("expected_name", [
+        "greet",
+        "formatGreeting",
+        "processAndGreet",  # arrow function
+    ])
+    def test_functions_extracted(self, index_js_fn_names: set[str], expected_name: str):
+        """Plain and arrow function declarations are both extracted."""
+        assert expected_name in index_js_fn_names
+
+    def test_extracts_class_methods(self, parsed_helpers_js):
+        methods = {fn.name for fn in parsed_helpers_js.functions if fn.class_name == "MathHelper"}
+        assert "add" in methods
+        assert "addAndFormat" in methods
+
+    def test_extracts_jsdoc(self, parsed_index_js):
+        greet_fn = next((fn for fn in parsed_index_js.functions if fn.name == "greet"), None)
         assert greet_fn is not None
         assert greet_fn.docstring is not None
         assert "Greet" in greet_fn.docstring
 
-    def test_extracts_call_edges(self, js_fixtures: Path):
-        source = (js_fixtures / "index.js").read_text()
-        result = self.parser.parse(Path("index.js"), source)
-
-        greet_calls = [c for c in result.calls if c.caller.name == "greet"]
-        callee_names = [c.callee_name for c in greet_calls]
-        assert "formatGreeting" in callee_names
-
-    def test_extracts_member_calls(self, js_fixtures: Path):
-        source = (js_fixtures / "helpers.js").read_text()
-        result = self.parser.parse(Path("helpers.js"), source)
-
-        af_calls = [c for c in result.calls if c.caller.name == "addAndFormat"]
-        callee_names = [c.callee_name for c in af_calls]
-        assert any("add" in n for n in callee_names)
+    def test_extracts_call_edges(self, parsed_index_js):
+        assert any(
+            c.caller.name == "greet" and c.callee_name == "formatGreeting"
+            for c in parsed_index_js.calls
+        )
+
+    def test_extracts_member_calls(self, parsed_helpers_js):
+        assert any(
+            c.caller.name == "addAndFormat" and "add" in c.callee_name
+            for c in parsed_helpers_js.calls
+        )
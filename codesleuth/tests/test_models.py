@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import pickle
 from pathlib import Path
 
+import pytest
+
 from codesleuth.models import CallEdge, CallGraph, FunctionNode, ParseResult
 
 
@@ -18,6 +21,25 @@ def _fn(name: str, file: str = "a.py", class_name: str | None = None, line: int
     )
 
 
+def _build_graph(
+    nodes_spec: list[tuple[str, str]],
+    edges_spec: list[tuple[str, str]],
+) -> CallGraph:
+    """Build a resolved CallGraph from ``(name, file)`` / ``(caller, callee)`` specs."""
+    nodes = {name: _fn(name, file) for name, file in nodes_spec}
+    edges = [
+        CallEdge(
+            caller=nodes[caller],
+            callee_name=callee,
+            file_path=nodes[caller].file_path,
+            line_number=i + 1,
+            resolved_callee=nodes[callee],
+        )
+        for i, (caller, callee) in enumerate(edges_spec)
+    ]
+    return CallGraph(nodes=list(nodes.values()), edges=edges)
+
+
 class TestFunctionNode:
     """Tests for FunctionNode hash and equality."""
 
@@ -46,6 +68,16 @@ class TestFunctionNode:
         a = _fn("foo")
         assert a != "not a node"
 
+    def test_hash_recomputed_on_unpickle(self):
+        """The cached hash is never persisted — it's seed-dependent."""
+        a = _fn("foo", "x.py")
+        assert "_hash" not in a.__getstate__()
+
+        b = pickle.loads(pickle.dumps(a))
+        assert b == a
+        assert hash(b) == hash(a)
+        assert b in {a}
+
 
 class TestCallGraph:
     """Tests for CallGraph and connected_components."""
@@ -60,59 +92,36 @@ class TestCallGraph:
         assert len(graph.resolved_edges) == 1
         assert graph.resolved_edges[0].resolved_callee == fn_b
 
-    def test_connected_components_single(self):
-        """A fully connected graph yields a single component."""
-        fn_a = _fn("a", "x.py")
-        fn_b = _fn("b", "x.py")
-        fn_c = _fn("c", "x.py")
-        e1 = CallEdge(caller=fn_a, callee_name="b", file_path=Path("x.py"), line_number=1, resolved_callee=fn_b)
-        e2 = CallEdge(caller=fn_b, callee_name="c", file_path=Path("x.py"), line_number=2, resolved_callee=fn_c)
-
-        graph = CallGraph(nodes=[fn_a, fn_b, fn_c], edges=[e1, e2])
-        comps = graph.connected_components()
-        assert len(comps) == 1
-        assert len(comps[0].nodes) == 3
-
-    def test_connected_components_multiple(self):
-        """Disconnected nodes form separate components."""
-        fn_a = _fn("a", "x.py")
-        fn_b = _fn("b", "x.py")
-        fn_c = _fn("c", "y.py")
-        fn_d = _fn("d", "y.py")
-        e1 = CallEdge(caller=fn_a, callee_name="b", file_path=Path("x.py"), line_number=1, resolved_callee=fn_b)
-        e2 = CallEdge(caller=fn_c, callee_name="d", file_path=Path("y.py"), line_number=1, resolved_callee=fn_d)
-
-        graph = CallGraph(nodes=[fn_a, fn_b, fn_c, fn_d], edges=[e1, e2])
-        comps = graph.connected_components()
-        assert len(comps) == 2
-        # Both components should have 2 nodes each.
-        sizes = sorted([len(c.nodes) for c in comps])
-        assert sizes == [2, 2]
-
-    def test_connected_components_with_isolated(self):
-        """Isolated nodes (no edges) each form their own component."""
-        fn_a = _fn("a")
-        fn_b = _fn("b")
-        fn_c = _fn("c")
-
-        graph = CallGraph(nodes=[fn_a, fn_b, fn_c], edges=[])
-        comps = graph.connected_components()
-        assert len(comps) == 3
-
-    def test_connected_components_sorted_by_size(self):
-        """Components are returned largest-first."""
-        fn_a = _fn("a", "x.py")
-        fn_b = _fn("b", "x.py")
-        fn_c = _fn("c", "x.py")
-        fn_d = _fn("d", "y.py")
-        e1 = CallEdge(caller=fn_a, callee_name="b", file_path=Path("x.py"), line_number=1, resolved_callee=fn_b)
-        e2 = CallEdge(caller=fn_b, callee_name="c", file_path=Path("x.py"), line_number=2, resolved_callee=fn_c)
-
-        graph = CallGraph(nodes=[fn_a, fn_b, fn_c, fn_d], edges=[e1, e2])
+    @pytest.mark.parametrize("nodes_spec, edges_spec, expected_sizes", [
+        # Fully connected graph → a single component.
+        (
+            [("a", "x.py"), ("b", "x.py"), ("c", "x.py")],
+            [("a", "b"), ("b", "c")],
+            [3],
+        ),
+        # Two disconnected pairs → two components.
+        (
+            [("a", "x.py"), ("b", "x.py"), ("c", "y.py"), ("d", "y.py")],
+            [("a", "b"), ("c", "d")],
+            [2, 2],
+        ),
+        # Isolated nodes (no edges) each form their own component.
+        (
+            [("a", "a.py"), ("b", "a.py"), ("c", "a.py")],
+            [],
+            [1, 1, 1],
+        ),
+        # Components come back largest-first.
+        (
+            [("a", "x.py"), ("b", "x.py"), ("c", "x.py"), ("d", "y.py")],
+            [("a", "b"), ("b", "c")],
+            [3, 1],
+        ),
+    ])
+    def test_connected_components(self, nodes_spec, edges_spec, expected_sizes):
+        graph = _build_graph(nodes_spec, edges_spec)
         comps = graph.connected_components()
-        assert len(comps) == 2
-        assert len(comps[0].nodes) == 3  # larger first
-        assert len(comps[1].nodes) == 1
+        assert [len(c.nodes) for c in comps] == expected_sizes
 
     def test_empty_graph_components(self):
         graph = CallGraph()
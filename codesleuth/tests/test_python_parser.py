@@ -4,93 +4,107 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from codesleuth.parsers.python_parser import PythonParser
 
 
+# One parser for the whole session — the instance is stateless.
+@pytest.fixture(scope="session")
+def py_parser() -> PythonParser:
+    return PythonParser()
+
+
+# Parsed once per session — each test only reads the results.
+@pytest.fixture(scope="session")
+def parsed_main_py(py_parser: PythonParser, python_fixtures: Path):
+    source = (python_fixtures / "main.py").read_text()
+    return py_parser.parse(Path("main.py"), source)
+
+
+@pytest.fixture(scope="session")
+def parsed_utils_py(py_parser: PythonParser, python_fixtures: Path):
+    source = (python_fixtures / "utils.py").read_text()
+    return py_parser.parse(Path("utils.py"), source)
+
+
+# Indexed views over the parsed fixture — O(1) lookups instead of a linear
+# scan of result.functions/result.calls per assertion.
+@pytest.fixture(scope="session")
+def main_py_by_name(parsed_main_py):
+    return {fn.name: fn for fn in parsed_main_py.functions}
+
+
+@pytest.fixture(scope="session")
+def main_py_calls_by_caller(parsed_main_py):
+    calls: dict[str, list] = {}
+    for call in parsed_main_py.calls:
+        calls.setdefault(call.caller.name, []).append(call)
+    return calls
+
+
 class TestPythonParser:
     """Tests for :class:`PythonParser`."""
 
-    def setup_method(self):
-        self.parser = PythonParser()
-
     # ------------------------------------------------------------------
     # Extension support
     # ------------------------------------------------------------------
 
-    def test_supported_extensions(self):
-        assert self.parser.supported_extensions() == ["py"]
+    def test_supported_extensions(self, py_parser: PythonParser):
+        assert py_parser.supported_extensions() == ["py"]
+
+    def test_quick_reject(self):
+        """Files without def/class are rejected; others are kept."""
+        assert PythonParser.quick_reject(b"from foo import bar\n")
+        assert not PythonParser.quick_reject(b"def foo(): pass\n")
+        assert not PythonParser.quick_reject(b"class Foo:\n    pass\n")
+        # Any whitespace may follow the keyword — tabs must not be rejected.
+        assert not PythonParser.quick_reject(b"def\tfoo(): pass\n")
+        assert not PythonParser.quick_reject(b"class\tFoo:\n    pass\n")
 
     # ------------------------------------------------------------------
     # Function extraction
     # ------------------------------------------------------------------
 
-    def test_extracts_top_level_functions(self, python_fixtures: Path):
-        source = (python_fixtures / "main.py").read_text()
-        result = self.parser.parse(Path("main.py"), source)
-
-        names = [fn.name for fn in result.functions]
-        assert "greet" in names
-        assert "format_greeting" in names
-
-    def test_extracts_class_methods(self, python_fixtures: Path):
-        source = (python_fixtures / "main.py").read_text()
-        result = self.parser.parse(Path("main.py"), source)
+    def test_extracts_top_level_functions(self, main_py_by_name):
+        assert "greet" in main_py_by_name
+        assert "format_greeting" in main_py_by_name
 
-        methods = [fn for fn in result.functions if fn.class_name == "Calculator"]
-        method_names = [m.name for m in methods]
-        assert "add" in method_names
-        assert "add_and_greet" in method_names
+    def test_extracts_class_methods(self, parsed_main_py):
+        methods = {fn.name for fn in parsed_main_py.functions if fn.class_name == "Calculator"}
+        assert "add" in methods
+        assert "add_and_greet" in methods
 
-    def test_extracts_docstrings(self, python_fixtures: Path):
-        source = (python_fixtures / "main.py").read_text()
-        result = self.parser.parse(Path("main.py"), source)
+    def test_extracts_docstrings(self, main_py_by_name):
+        assert main_py_by_name["greet"].docstring == "Return a greeting string."
 
-        greet_fn = next(fn for fn in result.functions if fn.name == "greet")
-        assert greet_fn.docstring == "Return a greeting string."
-
-    def test_extracts_parameters(self, python_fixtures: Path):
-        source = (python_fixtures / "main.py").read_text()
-        result = self.parser.parse(Path("main.py"), source)
-
-        greet_fn = next(fn for fn in result.functions if fn.name == "greet")
-        assert greet_fn.params == ["name"]
+    def test_extracts_parameters(self, main_py_by_name):
+        assert main_py_by_name["greet"].params == ["name"]
 
     # ------------------------------------------------------------------
     # Call extraction
     # ------------------------------------------------------------------
 
-    def test_extracts_function_calls(self, python_fixtures: Path):
-        source = (python_fixtures / "main.py").read_text()
-        result = self.parser.parse(Path("main.py"), source)
-
+    def test_extracts_function_calls(self, main_py_calls_by_caller):
         # greet() calls format_greeting()
-        greet_calls = [c for c in result.calls if c.caller.name == "greet"]
-        callee_names = [c.callee_name for c in greet_calls]
-        assert "format_greeting" in callee_names
-
-    def test_extracts_self_method_calls(self, python_fixtures: Path):
-        source = (python_fixtures / "main.py").read_text()
-        result = self.parser.parse(Path("main.py"), source)
+        greet_calls = main_py_calls_by_caller["greet"]
+        assert any(c.callee_name == "format_greeting" for c in greet_calls)
 
+    def test_extracts_self_method_calls(self, main_py_calls_by_caller):
         # add_and_greet calls self.add and greet
-        ag_calls = [c for c in result.calls if c.caller.name == "add_and_greet"]
-        callee_names = [c.callee_name for c in ag_calls]
-        assert "self.add" in callee_names
-        assert "greet" in callee_names
+        ag_calls = main_py_calls_by_caller["add_and_greet"]
+        assert any(c.callee_name == "self.add" for c in ag_calls)
+        assert any(c.callee_name == "greet" for c in ag_calls)
 
     # ------------------------------------------------------------------
     # Edge cases
     # ------------------------------------------------------------------
 
-    def test_handles_syntax_error_gracefully(self):
-        result = self.parser.parse(Path("bad.py"), "def broken(:\n  pass")
+    def test_handles_syntax_error_gracefully(self, py_parser: PythonParser):
+        result = py_parser.parse(Path("bad.py"), "def broken(:\n  pass")
         assert result.functions == []
         assert result.calls == []
 
-    def test_cross_file_functions(self, python_fixtures: Path):
-        source = (python_fixtures / "utils.py").read_text()
-        result = self.parser.parse(Path("utils.py"), source)
-
-        names = [fn.name for fn in result.functions]
-        assert "reverse_string" in names
-        assert "process" in names
+    def test_cross_file_functions(self, parsed_utils_py):
+        assert any(fn.name == "reverse_string" for fn in parsed_utils_py.functions)
+        assert any(fn.name == "process" for fn in parsed_utils_py.functions)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
@@ -17,43 +18,66 @@ def _make_registry() -> ParserRegistry:
     return reg
 
 
+# One canonical tree, built and scanned once — the read-only tests assert
+# different properties of the same scan instead of each assembling its own
+# directory structure.
+@pytest.fixture(scope="session")
+def sample_tree(tmp_path_factory) -> Path:
+    root = tmp_path_factory.mktemp("tree_src")
+    (root / "app.py").write_text("def app(): pass\n")
+    (root / "notes.txt").write_text("not code")
+
+    sub = root / "pkg" / "sub"
+    sub.mkdir(parents=True)
+    (sub / "deep.py").write_text("def deep(): pass\n")
+
+    cache_dir = root / "__pycache__"
+    cache_dir.mkdir()
+    (cache_dir / "mod.py").write_text("def cached(): pass\n")
+
+    nm = root / "node_modules"
+    nm.mkdir()
+    (nm / "lib.py").write_text("def lib(): pass\n")
+    return root
+
+
+@pytest.fixture(scope="session")
+def sample_tree_results(sample_tree: Path):
+    return FileScanner(sample_tree, _make_registry()).scan()
+
+
+# Gitignore-sensitive tree, built and scanned once. The compiled pathspec
+# lives on the scanner instance (parsed in __init__), so one scan also means
+# one .gitignore parse for the whole session.
+@pytest.fixture(scope="session")
+def gitignored_tree_results(tmp_path_factory):
+    root = tmp_path_factory.mktemp("gitignored_tree")
+    (root / ".gitignore").write_text("generated/\n")
+    gen_dir = root / "generated"
+    gen_dir.mkdir()
+    (gen_dir / "auto.py").write_text("def auto(): pass\n")
+    (root / "src.py").write_text("def src(): pass\n")
+    return FileScanner(root, _make_registry()).scan()
+
+
 class TestFileScanner:
     """Tests for :class:`FileScanner`."""
 
-    def test_discovers_python_files(self, tmp_path: Path):
+    def test_discovers_python_files(self, sample_tree_results):
         """Scanner finds .py files and parses them."""
-        (tmp_path / "hello.py").write_text("def greet(): pass\n")
-        scanner = FileScanner(tmp_path, _make_registry())
-        results = scanner.scan()
-
-        assert len(results) == 1
-        assert results[0].file_path == Path("hello.py")
-        names = [fn.name for fn in results[0].functions]
-        assert "greet" in names
+        by_path = {str(r.file_path): r for r in sample_tree_results}
+        assert "app.py" in by_path
+        assert "app" in [fn.name for fn in by_path["app.py"].functions]
 
-    def test_ignores_unsupported_extensions(self, tmp_path: Path):
+    def test_ignores_unsupported_extensions(self, sample_tree_results):
         """Non-supported files (e.g. .txt) are silently skipped."""
-        (tmp_path / "notes.txt").write_text("not code")
-        (tmp_path / "app.py").write_text("def run(): pass\n")
-        scanner = FileScanner(tmp_path, _make_registry())
-        results = scanner.scan()
+        assert "notes.txt" not in {str(r.file_path) for r in sample_tree_results}
 
-        assert len(results) == 1
-        assert results[0].file_path == Path("app.py")
-
-    def test_skips_always_skip_dirs(self, tmp_path: Path):
+    def test_skips_always_skip_dirs(self, sample_tree_results):
         """Directories in _ALWAYS_SKIP (e.g. __pycache__) are excluded."""
-        cache_dir = tmp_path / "__pycache__"
-        cache_dir.mkdir()
-        (cache_dir / "mod.py").write_text("def cached(): pass\n")
-
-        (tmp_path / "main.py").write_text("def main(): pass\n")
-        scanner = FileScanner(tmp_path, _make_registry())
-        results = scanner.scan()
-
-        assert len(results) == 1
-        file_paths = [r.file_path for r in results]
-        assert Path("main.py") in file_paths
+        assert not any(
+            "__pycache__" in r.file_path.parts for r in sample_tree_results
+        )
 
     def test_extra_excludes(self, tmp_path: Path):
         """CLI --exclude patterns filter out matching files."""
@@ -66,31 +90,16 @@ class TestFileScanner:
         assert len(results) == 1
         assert results[0].file_path == Path("app.py")
 
-    def test_respects_gitignore(self, tmp_path: Path):
+    def test_respects_gitignore(self, gitignored_tree_results):
         """Files matching .gitignore patterns are excluded."""
-        (tmp_path / ".gitignore").write_text("generated/\n")
-        gen_dir = tmp_path / "generated"
-        gen_dir.mkdir()
-        (gen_dir / "auto.py").write_text("def auto(): pass\n")
-
-        (tmp_path / "src.py").write_text("def src(): pass\n")
-        scanner = FileScanner(tmp_path, _make_registry())
-        results = scanner.scan()
-
-        assert len(results) == 1
-        assert results[0].file_path == Path("src.py")
+        assert len(gitignored_tree_results) == 1
+        assert gitignored_tree_results[0].file_path == Path("src.py")
 
-    def test_handles_nested_dirs(self, tmp_path: Path):
+    def test_handles_nested_dirs(self, sample_tree_results):
         """Scanner recurses into subdirectories."""
-        sub = tmp_path / "pkg" / "sub"
-        sub.mkdir(parents=True)
-        (sub / "deep.py").write_text("def deep(): pass\n")
-
-        scanner = FileScanner(tmp_path, _make_registry())
-        results = scanner.scan()
-
-        assert len(results) == 1
-        assert "deep" in [fn.name for fn in results[0].functions]
+        by_path = {str(r.file_path): r for r in sample_tree_results}
+        deep = by_path[str(Path("pkg") / "sub" / "deep.py")]
+        assert "deep" in [fn.name for fn in deep.functions]
 
     def test_empty_directory(self, tmp_path: Path):
         """Empty directories produce no results."""
@@ -98,15 +107,51 @@ class TestFileScanner:
         results = scanner.scan()
         assert results == []
 
-    def test_skips_node_modules(self, tmp_path: Path):
+    def test_parallel_scan_matches_serial(self, tmp_path: Path):
+        """Parallel scanning yields the same results as a serial scan."""
+        for i in range(10):
+            (tmp_path / f"mod{i}.py").write_text(f"def fn{i}(): pass\n")
+
+        serial = FileScanner(tmp_path, _make_registry()).scan(workers=1)
+        parallel = FileScanner(
+            tmp_path, _make_registry(), registry_factory=_make_registry
+        ).scan(workers=2)
+
+        assert sorted(str(r.file_path) for r in parallel) == sorted(
+            str(r.file_path) for r in serial
+        )
+
+    def test_cache_hits_on_second_scan(self, tmp_path: Path):
+        """A second scan with the same cache dir reuses stored results."""
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "app.py").write_text("def app(): pass\n")
+        cache_dir = tmp_path / "cache"
+
+        first = FileScanner(src, _make_registry(), cache_dir=cache_dir).scan()
+        assert list(cache_dir.rglob("*.pkl"))
+
+        second = FileScanner(src, _make_registry(), cache_dir=cache_dir).scan()
+        assert [str(r.file_path) for r in second] == [str(r.file_path) for r in first]
+        assert [fn.name for fn in second[0].functions] == ["app"]
+
+    def test_cache_invalidated_on_change(self, tmp_path: Path):
+        """Editing a file produces fresh results despite the cache."""
+        src = tmp_path / "src"
+        src.mkdir()
+        target = src / "app.py"
+        target.write_text("def before(): pass\n")
+        cache_dir = tmp_path / "cache"
+
+        FileScanner(src, _make_registry(), cache_dir=cache_dir).scan()
+        target.write_text("def after(): pass\n")
+        os.utime(target, ns=(1, 1))  # force a distinct mtime
+
+        results = FileScanner(src, _make_registry(), cache_dir=cache_dir).scan()
+        assert [fn.name for fn in results[0].functions] == ["after"]
+
+    def test_skips_node_modules(self, sample_tree_results):
         """node_modules is always excluded."""
-        nm = tmp_path / "node_modules"
-        nm.mkdir()
-        (nm / "lib.py").write_text("def lib(): pass\n")
-        (tmp_path / "app.py").write_text("def app(): pass\n")
-
-        scanner = FileScanner(tmp_path, _make_registry())
-        results = scanner.scan()
-
-        assert len(results) == 1
-        assert results[0].file_path == Path("app.py")
+        assert not any(
+            "node_modules" in r.file_path.parts for r in sample_tree_results
+        )